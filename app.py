@@ -1,36 +1,83 @@
 import os
+import re
 import time
+import asyncio
 import uuid
-import base64
+import heapq
+import sqlite3
+import threading
+import logging
+from email.utils import formatdate, parsedate_to_datetime
+from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Literal, List, Dict
+from typing import Final, Optional, Literal, List, Dict, Tuple
 
 from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
+from PIL import Image
+
+try:
+    # libbase64 com SIMD; bem mais rápido que o base64 da stdlib
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 load_dotenv()
 
+log = logging.getLogger("uvicorn.error")
+
+# Lida uma vez no start; trocar a chave exige reiniciar o serviço
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
+HAS_KEY = bool(OPENAI_API_KEY)
+
 BASE_DIR = Path(__file__).parent
 MEDIA_DIR = BASE_DIR / "media"
 IMG_DIR = MEDIA_DIR / "images"
 VID_DIR = MEDIA_DIR / "videos"
 TEMPLATES_DIR = BASE_DIR / "templates"
+DB_PATH = BASE_DIR / "refs.db"
+_MEDIA_DIR_STR = os.fspath(MEDIA_DIR)
+
+# Prefixos das URLs públicas (concatenação simples na montagem da galeria)
+_IMG_URL_PREFIX = "/media/images/"
+_IMG_DL_PREFIX = "/download/images/"
+_VID_URL_PREFIX = "/media/videos/"
+_VID_DL_PREFIX = "/download/videos/"
 
 IMG_DIR.mkdir(parents=True, exist_ok=True)
 VID_DIR.mkdir(parents=True, exist_ok=True)
-TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
+
+# TEMPLATE_RELOAD=1 em desenvolvimento para recarregar o HTML sem reiniciar
+TEMPLATE_RELOAD = os.getenv("TEMPLATE_RELOAD", "").strip() == "1"
 
 env = Environment(
-    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    loader=FileSystemLoader(os.fspath(TEMPLATES_DIR)),
     autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=TEMPLATE_RELOAD,
 )
+INDEX_TPL = env.get_template("index.html")
 
-app = FastAPI(title="Estúdio Ultra Real IA (Imagem + Vídeo)")
-app.mount("/media", StaticFiles(directory=str(MEDIA_DIR)), name="media")
+# Nomes aceitos em /download: só o que o próprio app gera (sem "/" nem "..")
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]{0,127}\.(?:png|mp4)")
+
+# Quantos itens (mais recentes) de cada tipo a galeria devolve
+GALLERY_LIMIT = int(os.getenv("GALLERY_LIMIT", "200"))
+
+# Máximo de cenas aceitas em /api/personagem/variacao/batch
+BATCH_MAX = int(os.getenv("BATCH_MAX", "8"))
+
+# Limita chamadas simultâneas à OpenAI (por processo) para não estourar o rate limit
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "5"))
+_OPENAI_SEM = asyncio.Semaphore(OPENAI_CONCURRENCY)
+
+app = FastAPI(title="Estúdio Ultra Real IA (Imagem + Vídeo)", default_response_class=ORJSONResponse)
+app.mount("/media", StaticFiles(directory=_MEDIA_DIR_STR), name="media")
 
 
 # -----------------------------
@@ -39,47 +86,158 @@ app.mount("/media", StaticFiles(directory=str(MEDIA_DIR)), name="media")
 def now_id(prefix: str) -> str:
     return f"{prefix}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
 
-def save_b64_to_png(b64_json: str, out_path: Path) -> None:
-    raw = base64.b64decode(b64_json)
-    out_path.write_bytes(raw)
+# Bloco de base64 decodificado por vez (múltiplo de 4 para não quebrar quadras)
+B64_CHUNK = 1 << 20
 
-def get_client() -> OpenAI:
-    key = os.getenv("OPENAI_API_KEY", "").strip()
-    if not key:
+def _decode_and_write(b64_json: str, out_path: Path) -> None:
+    # validate=True é o caminho rápido do pybase64 (o b64_json da OpenAI não tem espaços)
+    # grava num .tmp e renomeia: a galeria nunca lista um PNG pela metade
+    tmp_path = out_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            for i in range(0, len(b64_json), B64_CHUNK):
+                f.write(base64.b64decode(b64_json[i:i + B64_CHUNK], validate=True))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+async def save_b64_to_png(b64_json: str, out_path: Path) -> None:
+    # decodifica e grava fora do event loop
+    await asyncio.to_thread(_decode_and_write, b64_json, out_path)
+
+_client: Optional[AsyncOpenAI] = None
+
+def get_client() -> AsyncOpenAI:
+    global _client
+    if not HAS_KEY:
         raise HTTPException(
             status_code=500,
             detail="OPENAI_API_KEY não configurada no Render. Vá em Settings → Environment e adicione OPENAI_API_KEY.",
         )
-    return OpenAI(api_key=key)
-
-def list_gallery() -> Dict[str, List[Dict[str, str]]]:
-    images = sorted([p.name for p in IMG_DIR.glob("*.png")], reverse=True)
-    videos = sorted([p.name for p in VID_DIR.glob("*.mp4")], reverse=True)
+    # Um único cliente por processo: reaproveita o pool de conexões httpx
+    if _client is None:
+        _client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    return _client
+
+def gallery_key() -> Tuple[int, int]:
+    # mtime das pastas muda quando um arquivo é criado/removido
+    return IMG_DIR.stat().st_mtime_ns, VID_DIR.stat().st_mtime_ns
+
+def newest_names(folder: Path, suffix: str, limit: int) -> List[str]:
+    # ordena pela data de modificação, não pelo timestamp embutido no nome;
+    # só lista o que /download aceita (mesma regra _SAFE_NAME)
+    with os.scandir(folder) as it:
+        entries = [
+            (e.stat().st_mtime_ns, e.name)
+            for e in it
+            if e.name.endswith(suffix) and _SAFE_NAME.fullmatch(e.name) and e.is_file()
+        ]
+    return [name for _, name in heapq.nlargest(limit, entries)]
+
+def _scan_gallery() -> Dict[str, List[Dict[str, str]]]:
+    images = newest_names(IMG_DIR, ".png", GALLERY_LIMIT)
+    videos = newest_names(VID_DIR, ".mp4", GALLERY_LIMIT)
     return {
-        "images": [{"name": n, "url": f"/media/images/{n}", "download": f"/download/images/{n}"} for n in images],
-        "videos": [{"name": n, "url": f"/media/videos/{n}", "download": f"/download/videos/{n}"} for n in videos],
+        "images": [{"name": n, "url": _IMG_URL_PREFIX + n, "download": _IMG_DL_PREFIX + n} for n in images],
+        "videos": [{"name": n, "url": _VID_URL_PREFIX + n, "download": _VID_DL_PREFIX + n} for n in videos],
     }
 
-def ultra_real_style() -> str:
-    return (
-        "fotografia hiper-realista, pele humana real com poros visíveis, microtextura, "
-        "micro imperfeições naturais, sinais de expressão sutis, detalhes finos, "
-        "iluminação natural/cinematográfica realista, lente 85mm, profundidade de campo suave, "
-        "cores naturais, alta nitidez no rosto, sem aparência de CGI, sem cartoon, sem ilustração"
-    )
+@lru_cache(maxsize=1)
+def gallery_body(key: Tuple[int, int]) -> bytes:
+    # JSON já serializado: um acerto de cache não refaz nenhum trabalho
+    return orjson.dumps(_scan_gallery())
+
+def gallery_etag(key: Tuple[int, int]) -> str:
+    return f'"g-{key[0]:x}-{key[1]:x}"'
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+def is_not_modified(request: Request, etag: str, mtime: Optional[float] = None) -> bool:
+    # If-None-Match tem prioridade sobre If-Modified-Since (RFC 9110)
+    # comparação fraca: proxies/CDNs costumam trocar "x" por W/"x"
+    inm = request.headers.get("if-none-match")
+    if inm is not None:
+        if inm.strip() == "*":
+            return True
+        return _strip_weak(etag) in [_strip_weak(t.strip()) for t in inm.split(",")]
+    ims = request.headers.get("if-modified-since")
+    if ims and mtime is not None:
+        try:
+            return int(mtime) <= parsedate_to_datetime(ims).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+ULTRA_REAL_STYLE: Final[str] = (
+    "fotografia hiper-realista, pele humana real com poros visíveis, microtextura, "
+    "micro imperfeições naturais, sinais de expressão sutis, detalhes finos, "
+    "iluminação natural/cinematográfica realista, lente 85mm, profundidade de campo suave, "
+    "cores naturais, alta nitidez no rosto, sem aparência de CGI, sem cartoon, sem ilustração"
+)
 
-def character_ref_file(character_id: str) -> Path:
-    return IMG_DIR / f"{character_id}.ref.txt"
+# Prompts montados uma vez; por requisição só entram os campos do formulário
+PERSONAGEM_PROMPT: Final[str] = (
+    "Crie um retrato fotográfico ultra-realista de um personagem IA fictício (não baseado em pessoa real). "
+    "Nome do personagem: {nome}. "
+    "Descrição: {descricao}. "
+    "Foco: rosto em destaque, identidade facial consistente, detalhes realistas da pele. "
+    "Estilo: " + ULTRA_REAL_STYLE + "."
+    "Fundo simples e limpo, sem texto, sem marca d'água."
+)
 
-def set_character_ref(character_id: str, filename: str) -> None:
-    character_ref_file(character_id).write_text(filename, encoding="utf-8")
+VARIACAO_PROMPT: Final[str] = (
+    "Use a imagem enviada como referência do MESMO personagem (mesmo rosto). "
+    "Nova cena/ambiente: {cena}. "
+    "Permita alterações de roupa/pose/cenário, mas mantenha a identidade facial consistente. "
+    "Estilo: " + ULTRA_REAL_STYLE + ". Sem texto, sem marca d'água."
+)
 
-def get_character_ref(character_id: str) -> Optional[str]:
-    p = character_ref_file(character_id)
-    if not p.exists():
-        return None
-    v = p.read_text(encoding="utf-8").strip()
-    return v or None
+def open_refs_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(os.fspath(DB_PATH), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS refs(id TEXT PRIMARY KEY, filename TEXT NOT NULL)")
+    # migra os antigos <id>.ref.txt da galeria para o banco; BEGIN IMMEDIATE
+    # serializa os workers que importam o módulo ao mesmo tempo
+    conn.execute("BEGIN IMMEDIATE")
+    migrated: List[Path] = []
+    with conn:
+        for p in IMG_DIR.glob("*.ref.txt"):
+            try:
+                v = p.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                continue  # outro processo já migrou
+            except (OSError, UnicodeDecodeError) as e:
+                log.warning("ref ignorada (fica no disco): %s: %s", p.name, e)
+                continue
+            if v:
+                conn.execute("INSERT OR IGNORE INTO refs(id, filename) VALUES (?, ?)", (p.name[:-len(".ref.txt")], v))
+            migrated.append(p)
+    # só apaga depois do commit: se algo falhar acima, os arquivos continuam lá
+    for p in migrated:
+        p.unlink(missing_ok=True)
+    return conn
+
+refs_db = open_refs_db()
+# a conexão é compartilhada entre as threads do to_thread
+_refs_lock = threading.Lock()
+
+def _set_ref_sync(character_id: str, filename: str) -> None:
+    with _refs_lock:
+        refs_db.execute("INSERT OR REPLACE INTO refs(id, filename) VALUES (?, ?)", (character_id, filename))
+        refs_db.commit()
+
+def _get_ref_sync(character_id: str) -> Optional[str]:
+    with _refs_lock:
+        row = refs_db.execute("SELECT filename FROM refs WHERE id = ?", (character_id,)).fetchone()
+    return row[0] if row else None
+
+async def set_character_ref(character_id: str, filename: str) -> None:
+    await asyncio.to_thread(_set_ref_sync, character_id, filename)
+
+async def get_character_ref(character_id: str) -> Optional[str]:
+    return await asyncio.to_thread(_get_ref_sync, character_id)
 
 
 # -----------------------------
@@ -87,34 +245,48 @@ def get_character_ref(character_id: str) -> Optional[str]:
 # -----------------------------
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request):
-    tpl = env.get_template("index.html")
-    has_key = bool(os.getenv("OPENAI_API_KEY", "").strip())
-    return tpl.render(has_key=has_key)
+    tpl = env.get_template("index.html") if TEMPLATE_RELOAD else INDEX_TPL
+    return tpl.render(has_key=HAS_KEY)
 
 
 # -----------------------------
 # Galeria / Download
 # -----------------------------
 @app.get("/api/galeria")
-def api_galeria():
-    return JSONResponse(list_gallery())
+def api_galeria(request: Request):
+    key = gallery_key()
+    headers = {"ETag": gallery_etag(key), "Cache-Control": "no-cache"}
+    if is_not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=gallery_body(key), media_type="application/json", headers=headers)
 
 @app.get("/download/{kind}/{filename}")
-def download(kind: str, filename: str):
+def download(kind: str, filename: str, request: Request):
     if kind not in ("images", "videos"):
         raise HTTPException(400, "Tipo inválido.")
+    if not _SAFE_NAME.fullmatch(filename):
+        raise HTTPException(400, "Nome de arquivo inválido.")
     base = IMG_DIR if kind == "images" else VID_DIR
     path = base / filename
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise HTTPException(404, "Arquivo não encontrado.")
-    return FileResponse(path, filename=filename)
+    headers = {
+        "ETag": f'"{st.st_size:x}-{st.st_mtime_ns:x}"',
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": "public, max-age=3600",
+    }
+    if is_not_modified(request, headers["ETag"], st.st_mtime):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, filename=filename, headers=headers, stat_result=st)
 
 
 # -----------------------------
 # 1) Criar personagem (imagem base)
 # -----------------------------
 @app.post("/api/personagem/criar")
-def criar_personagem(
+async def criar_personagem(
     nome: str = Form(...),
     descricao: str = Form(...),
     size: Literal["1024x1024", "1536x1024", "1024x1536"] = Form("1024x1024"),
@@ -123,61 +295,42 @@ def criar_personagem(
 
     character_id = uuid.uuid4().hex
 
-    prompt = (
-        f"Crie um retrato fotográfico ultra-realista de um personagem IA fictício (não baseado em pessoa real). "
-        f"Nome do personagem: {nome}. "
-        f"Descrição: {descricao}. "
-        f"Foco: rosto em destaque, identidade facial consistente, detalhes realistas da pele. "
-        f"Estilo: {ultra_real_style()}."
-        f"Fundo simples e limpo, sem texto, sem marca d'água."
-    )
+    prompt = PERSONAGEM_PROMPT.format(nome=nome, descricao=descricao)
 
-    result = client.images.generate(
-        model="gpt-image-1",
-        prompt=prompt,
-        size=size
-    )
+    async with _OPENAI_SEM:
+        result = await client.images.generate(
+            model="gpt-image-1",
+            prompt=prompt,
+            size=size
+        )
 
     b64 = result.data[0].b64_json
     filename = f"{now_id('personagem')}.png"
     out_path = IMG_DIR / filename
-    save_b64_to_png(b64, out_path)
+    await save_b64_to_png(b64, out_path)
 
-    set_character_ref(character_id, filename)
+    await set_character_ref(character_id, filename)
 
-    return {"character_id": character_id, "image_name": filename, "image_url": f"/media/images/{filename}"}
+    return {"character_id": character_id, "image_name": filename, "image_url": _IMG_URL_PREFIX + filename}
 
 
 # -----------------------------
 # 2) Variação (mesmo rosto + novo ambiente)
 # -----------------------------
-@app.post("/api/personagem/variacao")
-def gerar_variacao(
-    character_id: str = Form(...),
-    base_image: str = Form(...),  # nome do arquivo .png da galeria
-    cena: str = Form(...),
-    size: Literal["1024x1024", "1536x1024", "1024x1536"] = Form("1024x1024"),
-):
-    client = get_client()
-
-    base_name = base_image.split("/")[-1]
-    ref_path = IMG_DIR / base_name
-    if not ref_path.exists():
-        raise HTTPException(404, "Imagem base não encontrada na galeria.")
-
-    prompt = (
-        "Use a imagem enviada como referência do MESMO personagem (mesmo rosto). "
-        f"Nova cena/ambiente: {cena}. "
-        "Permita alterações de roupa/pose/cenário, mas mantenha a identidade facial consistente. "
-        f"Estilo: {ultra_real_style()}. Sem texto, sem marca d'água."
-    )
+async def one_variation(
+    client: AsyncOpenAI,
+    ref_image: Tuple[str, bytes, str],
+    cena: str,
+    size: str,
+) -> Dict[str, str]:
+    prompt = VARIACAO_PROMPT.format(cena=cena)
 
     # Tenta editar com imagem de referência (melhor consistência)
     try:
-        with open(ref_path, "rb") as img:
-            result = client.images.edit(
+        async with _OPENAI_SEM:
+            result = await client.images.edit(
                 model="gpt-image-1",
-                image=img,
+                image=ref_image,
                 prompt=prompt,
                 size=size
             )
@@ -185,26 +338,107 @@ def gerar_variacao(
         method = "reference-image"
     except Exception:
         # fallback: só texto (pode variar mais o rosto)
-        result = client.images.generate(
-            model="gpt-image-1",
-            prompt=prompt,
-            size=size
-        )
+        async with _OPENAI_SEM:
+            result = await client.images.generate(
+                model="gpt-image-1",
+                prompt=prompt,
+                size=size
+            )
         b64 = result.data[0].b64_json
         method = "text-fallback"
 
     filename = f"{now_id('variacao')}.png"
     out_path = IMG_DIR / filename
-    save_b64_to_png(b64, out_path)
+    await save_b64_to_png(b64, out_path)
+
+    return {"method": method, "image_name": filename, "image_url": _IMG_URL_PREFIX + filename}
+
+# Maior lado da imagem de referência enviada ao images.edit
+EDIT_MAX_EDGE = 1024
+
+@lru_cache(maxsize=32)
+def _shrink_for_edit(ref_path: Path, mtime_ns: int) -> Tuple[str, bytes, str]:
+    try:
+        with Image.open(ref_path) as img:
+            img.thumbnail((EDIT_MAX_EDGE, EDIT_MAX_EDGE), Image.LANCZOS)
+            buf = BytesIO()
+            if img.mode == "RGB":
+                img.save(buf, format="JPEG", quality=92)
+                return f"{ref_path.stem}.jpg", buf.getvalue(), "image/jpeg"
+            img.save(buf, format="PNG")
+            return f"{ref_path.stem}.png", buf.getvalue(), "image/png"
+    except (OSError, ValueError, Image.DecompressionBombError):
+        # Pillow não leu/regravou (arquivo corrompido, CMYK...): envia o original;
+        # se a OpenAI recusar, one_variation cai no text-fallback
+        return ref_path.name, ref_path.read_bytes(), "image/png"
+
+def ref_image_for_edit(ref_path: Path) -> Tuple[str, bytes, str]:
+    # reduzida uma vez por versão do arquivo; upload menor e longe do limite de 4MB
+    return _shrink_for_edit(ref_path, ref_path.stat().st_mtime_ns)
+
+def base_image_path(base_image: str) -> Path:
+    base_name = base_image.split("/")[-1]
+    if not _SAFE_NAME.fullmatch(base_name):
+        raise HTTPException(400, "Nome da imagem base inválido.")
+    ref_path = IMG_DIR / base_name
+    if not ref_path.is_file():
+        raise HTTPException(404, "Imagem base não encontrada na galeria.")
+    return ref_path
+
+@app.post("/api/personagem/variacao")
+async def gerar_variacao(
+    character_id: str = Form(...),
+    base_image: str = Form(...),  # nome do arquivo .png da galeria
+    cena: str = Form(...),
+    size: Literal["1024x1024", "1536x1024", "1024x1536"] = Form("1024x1024"),
+):
+    client = get_client()
+
+    ref_path = base_image_path(base_image)
+    ref_image = await asyncio.to_thread(ref_image_for_edit, ref_path)
+
+    return await one_variation(client, ref_image, cena, size)
+
+@app.post("/api/personagem/variacao/batch")
+async def gerar_variacao_batch(
+    character_id: str = Form(...),
+    base_image: str = Form(...),
+    cenas: List[str] = Form(...),  # uma cena por campo
+    size: Literal["1024x1024", "1536x1024", "1024x1536"] = Form("1024x1024"),
+):
+    client = get_client()
 
-    return {"method": method, "image_name": filename, "image_url": f"/media/images/{filename}"}
+    cenas = [c.strip() for c in cenas if c.strip()]
+    if not cenas:
+        raise HTTPException(400, "Informe ao menos uma cena.")
+    if len(cenas) > BATCH_MAX:
+        raise HTTPException(400, f"Máximo de {BATCH_MAX} cenas por lote.")
+
+    ref_path = base_image_path(base_image)
+    ref_image = await asyncio.to_thread(ref_image_for_edit, ref_path)
+
+    # todas as cenas em paralelo (o semáforo segura o excesso); uma falha não derruba o lote
+    results = await asyncio.gather(
+        *(one_variation(client, ref_image, c, size) for c in cenas),
+        return_exceptions=True,
+    )
+
+    items = []
+    for cena, r in zip(cenas, results):
+        if isinstance(r, BaseException):
+            # detalhe (erro da OpenAI/SDK) só no log do servidor
+            log.warning("variação em lote falhou (cena=%r)", cena, exc_info=(type(r), r, r.__traceback__))
+            items.append({"cena": cena, "error": "Falha ao gerar esta variação."})
+        else:
+            items.append({"cena": cena, **r})
+    return {"results": items}
 
 
 # -----------------------------
 # 3) Vídeo (rota pronta – depende do endpoint disponível na sua conta)
 # -----------------------------
 @app.post("/api/personagem/video")
-def gerar_video(
+async def gerar_video(
     base_image: str = Form(...),
     prompt_video: str = Form(...),
 ):
@@ -218,4 +452,20 @@ def gerar_video(
         status_code=501,
         detail="Geração de vídeo: sua conta/endpoint ainda não está ativado neste app. "
                "Se você me disser qual provedor/modelo de vídeo você quer usar, eu integro (OpenAI se disponível, ou outro)."
-    )
\ No newline at end of file
+    )
+
+# -----------------------------
+# Execução (python app.py)
+# -----------------------------
+if __name__ == "__main__":
+    import uvicorn
+
+    # cada worker tem seu próprio cliente e semáforo: total = workers × OPENAI_CONCURRENCY
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+    )